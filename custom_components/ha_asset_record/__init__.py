@@ -24,6 +24,7 @@ DATA_PANEL_REGISTERED = f"{DOMAIN}_panel_registered"
 
 async def async_setup_entry(hass: HomeAssistant, entry: AssetConfigEntry) -> bool:
     """Set up Ha Asset Record from a config entry."""
+    data = hass.data
     coordinator = AssetCoordinator(hass, entry)
 
     # [C-01] The coordinator's async_load handles internal errors gracefully
@@ -38,15 +39,15 @@ async def async_setup_entry(hass: HomeAssistant, entry: AssetConfigEntry) -> boo
 
     # [H-12] Store coordinator in hass.data[DOMAIN] following standard HA
     # pattern (see shopping_list). This is a single-instance integration.
-    hass.data[DOMAIN] = coordinator
+    data[DOMAIN] = coordinator
 
     entry.runtime_data = coordinator
 
     # Register websocket commands and panel (only once)
-    if not hass.data.get(DATA_PANEL_REGISTERED):
+    if not data.get(DATA_PANEL_REGISTERED):
         async_register_websocket_commands(hass)
         await async_register_panel(hass)
-        hass.data[DATA_PANEL_REGISTERED] = True
+        data[DATA_PANEL_REGISTERED] = True
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
@@ -57,21 +58,24 @@ async def async_setup_entry(hass: HomeAssistant, entry: AssetConfigEntry) -> boo
 
 async def async_unload_entry(hass: HomeAssistant, entry: AssetConfigEntry) -> bool:
     """Unload a config entry."""
+    # Persist any pending delayed save before the coordinator is dropped.
+    await entry.runtime_data.async_flush()
+
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
     # Unregister panel if this is the last entry
     if unload_ok:
-        remaining_entries = [
-            e for e in hass.config_entries.async_entries(DOMAIN)
-            if e.entry_id != entry.entry_id
-        ]
-        if not remaining_entries:
-            if hass.data.get(DATA_PANEL_REGISTERED):
+        has_remaining = any(
+            e.entry_id != entry.entry_id
+            for e in hass.config_entries.async_entries(DOMAIN)
+        )
+        if not has_remaining:
+            # [L-04] Clean up tracking keys from hass.data
+            data = hass.data
+            if data.pop(DATA_PANEL_REGISTERED, None):
                 # [M-14] unregister_panel is synchronous (no awaits)
                 unregister_panel(hass)
-            # [L-04] Clean up tracking keys from hass.data
-            hass.data.pop(DATA_PANEL_REGISTERED, None)
-            hass.data.pop(DOMAIN, None)
+            data.pop(DOMAIN, None)
 
     return unload_ok
 
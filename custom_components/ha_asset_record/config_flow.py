@@ -149,15 +149,13 @@ class HaAssetRecordOptionsFlow(OptionsFlow):
                     data={**self.config_entry.options},
                 )
 
-        asset_options = {
-            asset.id: asset.name for asset in assets.values()
-        }
-
         return self.async_show_form(
             step_id="delete_asset",
             data_schema=vol.Schema(
                 {
-                    vol.Required("asset_id"): vol.In(asset_options),
+                    vol.Required("asset_id"): vol.In(
+                        self.coordinator.asset_name_map
+                    ),
                 }
             ),
             errors=errors,
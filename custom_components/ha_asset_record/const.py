@@ -11,6 +11,8 @@ DOMAIN: Final = "ha_asset_record"
 # Storage
 STORAGE_KEY: Final = DOMAIN
 STORAGE_VERSION: Final = 1
+# Seconds to coalesce rapid mutations into a single storage write
+SAVE_DELAY: Final = 10
 
 # Platforms  [H-01] Use Platform enum instead of raw strings
 PLATFORMS: Final = [Platform.DATETIME, Platform.TEXT, Platform.NUMBER]
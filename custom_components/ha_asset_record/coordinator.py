@@ -2,18 +2,21 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+import asyncio
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass, field
 from datetime import datetime
-from functools import partial
+from functools import lru_cache
 import logging
+from secrets import token_hex
 from types import MappingProxyType
 from typing import Any
-import uuid
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.json import json_bytes
 from homeassistant.helpers.storage import Store
 from homeassistant.util import dt as dt_util
 
@@ -27,26 +30,29 @@ from .const import (
     FIELD_PURCHASE_AT,
     FIELD_VALUE,
     FIELD_WARRANTY_UNTIL,
+    SAVE_DELAY,
     STORAGE_KEY,
     STORAGE_VERSION,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
-# [M-01] Expected types for each mutable asset field, used for input validation.
-_FIELD_TYPES: dict[str, tuple[type, ...]] = {
-    FIELD_NAME: (str,),
-    FIELD_BRAND: (str,),
-    FIELD_CATEGORY: (str,),
-    FIELD_VALUE: (int, float),
-    FIELD_PURCHASE_AT: (datetime, type(None)),
-    FIELD_WARRANTY_UNTIL: (datetime, type(None)),
-    FIELD_MANUAL_MD: (str,),
-    FIELD_MAINTENANCE_MD: (str,),
+# [M-01] Per mutable asset field: the accepted value types, and whether the
+# value is a datetime to normalize to timezone-aware UTC on update.  One
+# lookup yields both.
+_FIELD_SPECS: dict[str, tuple[tuple[type, ...], bool]] = {
+    FIELD_NAME: ((str,), False),
+    FIELD_BRAND: ((str,), False),
+    FIELD_CATEGORY: ((str,), False),
+    FIELD_VALUE: ((int, float), False),
+    FIELD_PURCHASE_AT: ((datetime, type(None)), True),
+    FIELD_WARRANTY_UNTIL: ((datetime, type(None)), True),
+    FIELD_MANUAL_MD: ((str,), False),
+    FIELD_MAINTENANCE_MD: ((str,), False),
 }
 
 
-def _parse_datetime_safe(raw: str | None) -> datetime | None:
+def _parse_datetime_safe(raw: Any) -> datetime | None:
     """Parse an ISO datetime string, returning *None* on failure.
 
     [L-02] Individual field parsing is wrapped so that a single corrupt
@@ -55,30 +61,57 @@ def _parse_datetime_safe(raw: str | None) -> datetime | None:
     """
     if not raw:
         return None
+    if not isinstance(raw, str):
+        # Also keeps unhashable values away from the lru_cache below.
+        _LOGGER.warning("Failed to parse datetime '%s': not a string", raw)
+        return None
+    return _parse_iso_utc(raw)
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso_utc(raw: str) -> datetime | None:
+    """Parse a non-empty ISO 8601 string into an aware UTC datetime.
+
+    Memoized because created_at/updated_at are frequently identical
+    (and bulk-imported assets share timestamps); datetimes are immutable
+    so sharing the parsed result is safe.
+    """
     try:
-        parsed = dt_util.parse_datetime(raw)
-        if parsed is None:
-            return None
+        # Values are written by HA's encoder in ISO 8601, which the C
+        # implementation of fromisoformat() parses directly (including a
+        # trailing "Z" on Python 3.11+).
+        parsed = datetime.fromisoformat(raw)
         # [M-07] Guarantee timezone-aware UTC datetime
         if parsed.tzinfo is None:
             return dt_util.as_utc(parsed.replace(tzinfo=dt_util.UTC))
         return dt_util.as_utc(parsed)
-    except (ValueError, TypeError, OverflowError) as err:
+    except (ValueError, OverflowError) as err:
         _LOGGER.warning("Failed to parse datetime '%s': %s", raw, err)
         return None
 
 
+def _generate_asset_id() -> str:
+    """Return a new asset id.
+
+    [H-04] 32 hex chars (128 random bits, same width as uuid4().hex)
+    so collisions are not a practical concern.
+    """
+    return f"asset_{token_hex(16)}"
+
+
 def _ensure_aware_utc(dt_value: datetime) -> datetime:
     """Ensure a datetime is timezone-aware and in UTC.
 
     [L-11] Unified datetime handling for create/update paths.
     """
+    if dt_value.tzinfo is dt_util.UTC:
+        return dt_value
     if dt_value.tzinfo is None:
         return dt_value.replace(tzinfo=dt_util.UTC)
     return dt_util.as_utc(dt_value)
 
 
-@dataclass
+@dataclass(slots=True)
 class Asset:
     """Represents an asset."""
 
@@ -93,24 +126,37 @@ class Asset:
     maintenance_md: str = ""
     created_at: datetime = field(default_factory=dt_util.utcnow)
     updated_at: datetime = field(default_factory=dt_util.utcnow)
+    # Serialized form reused across saves; reset to None on mutation.
+    _cached_dict: dict[str, Any] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def to_dict(self) -> dict[str, Any]:
-        """Convert asset to dictionary for storage."""
-        return {
+        """Convert asset to dictionary for storage.
+
+        Datetimes are left as objects: HA's orjson-based encoder (used by
+        both Store and the websocket API) serializes them natively to the
+        same ISO 8601 strings isoformat() would produce.
+
+        The result is memoized so that saves only re-serialize assets that
+        changed since the last call.  Callers must not mutate it.
+        """
+        if self._cached_dict is not None:
+            return self._cached_dict
+        self._cached_dict = {
             "id": self.id,
             "name": self.name,
             "brand": self.brand,
             "category": self.category,
             "value": self.value,
-            "purchase_at": self.purchase_at.isoformat() if self.purchase_at else None,
-            "warranty_until": (
-                self.warranty_until.isoformat() if self.warranty_until else None
-            ),
+            "purchase_at": self.purchase_at,
+            "warranty_until": self.warranty_until,
             "manual_md": self.manual_md,
             "maintenance_md": self.maintenance_md,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat(),
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
         }
+        return self._cached_dict
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> Asset:
@@ -120,6 +166,9 @@ class Asset:
         degrade gracefully rather than preventing the asset from loading.
         [M-07] All datetime fields are guaranteed timezone-aware (UTC).
         """
+        # "id" is required; every other key is optional.
+        asset_id = data["id"]
+
         # [L-02] Parse optional datetime fields safely
         purchase_at = _parse_datetime_safe(data.get("purchase_at"))
         warranty_until = _parse_datetime_safe(data.get("warranty_until"))
@@ -132,18 +181,19 @@ class Asset:
         updated_at = updated_raw if updated_raw is not None else dt_util.utcnow()
 
         # [L-02] Parse numeric value defensively
+        raw_value = data.get("value", 0)
         try:
-            value = float(data.get("value", 0))
+            value = float(raw_value)
         except (ValueError, TypeError):
             _LOGGER.warning(
                 "Invalid value '%s' for asset %s, defaulting to 0",
-                data.get("value"),
-                data.get("id", "unknown"),
+                raw_value,
+                asset_id,
             )
             value = 0
 
         return cls(
-            id=data["id"],
+            id=asset_id,
             name=data.get("name", ""),
             brand=data.get("brand", ""),
             category=data.get("category", ""),
@@ -175,10 +225,38 @@ class AssetCoordinator:
             hass, STORAGE_VERSION, STORAGE_KEY
         )
         self._assets: dict[str, Asset] = {}
+        # The proxy reflects mutations of _assets live, so one instance
+        # can be handed out for the coordinator's lifetime.
+        self._assets_view = MappingProxyType(self._assets)
+        # True once assets changed since load or the last async_flush().
+        # Not cleared by delayed saves: Store only logs a failed write, so
+        # unload must not assume the data reached disk.
+        self._dirty = False
+        # Serialized assets shared by saves and the websocket list command.
+        # Replaced (never mutated) on change, so handed-out lists stay valid.
+        self._asset_dicts: list[dict[str, Any]] | None = None
+        # JSON encoding of {"assets": asset_dicts}, reused by every list
+        # request until the next mutation.
+        self._assets_json: bytes | None = None
+        # Asset id -> name, kept in sync on create/delete/rename so the
+        # options flow does not rebuild it on every form render.
+        self._id_to_name: dict[str, str] = {}
+        self._id_to_name_view = MappingProxyType(self._id_to_name)
         # [M-03] Dict-based listeners with integer keys for O(1) add/remove,
-        # following the pattern from HA DataUpdateCoordinator.
-        self._listeners: dict[int, Callable[[], None]] = {}
+        # following the pattern from HA DataUpdateCoordinator.  Buckets are
+        # keyed by asset id so an update only reaches the entities of the
+        # asset that changed; the None bucket fires when assets are created
+        # or deleted.
+        self._listeners: dict[str | None, dict[int, Callable[[], None]]] = {}
+        # Immutable copy of each bucket, rebuilt only on add/remove so
+        # dispatch does not allocate.
+        self._listener_snapshots: dict[
+            str | None, tuple[Callable[[], None], ...]
+        ] = {}
         self._last_listener_id: int = 0
+        # Live entities per asset id, so deleting an asset can remove its
+        # entities in one batch instead of each scheduling its own task.
+        self._entities: dict[str, set[Entity]] = {}
 
     @property
     def assets(self) -> MappingProxyType[str, Asset]:
@@ -186,7 +264,35 @@ class AssetCoordinator:
 
         [M-04] Consumers cannot accidentally mutate the internal dict.
         """
-        return MappingProxyType(self._assets)
+        return self._assets_view
+
+    @property
+    def asset_dicts(self) -> list[dict[str, Any]]:
+        """Return all assets serialized via Asset.to_dict.
+
+        Cached until the next mutation; callers must not modify the list.
+        """
+        if self._asset_dicts is None:
+            # Mapping the unbound method over the values view avoids a
+            # per-asset attribute lookup, and unchanged assets return their
+            # memoized dict.
+            self._asset_dicts = list(map(Asset.to_dict, self._assets.values()))
+        return self._asset_dicts
+
+    @property
+    def assets_json(self) -> bytes:
+        """Return {"assets": asset_dicts} encoded as JSON.
+
+        Cached until the next mutation.
+        """
+        if self._assets_json is None:
+            self._assets_json = json_bytes({"assets": self.asset_dicts})
+        return self._assets_json
+
+    @property
+    def asset_name_map(self) -> MappingProxyType[str, str]:
+        """Return a read-only mapping of asset id to asset name."""
+        return self._id_to_name_view
 
     async def async_load(self) -> None:
         """Load assets from storage.
@@ -210,6 +316,7 @@ class AssetCoordinator:
                 try:
                     asset = Asset.from_dict(asset_data)
                     self._assets[asset.id] = asset
+                    self._id_to_name[asset.id] = asset.name
                 except Exception:
                     _LOGGER.warning(
                         "Skipping corrupt asset record: %s",
@@ -218,57 +325,134 @@ class AssetCoordinator:
                     )
         _LOGGER.debug("Loaded %d assets", len(self._assets))
 
-    async def _async_save(self) -> None:
-        """Save assets to storage."""
-        data = {
-            "assets": [asset.to_dict() for asset in self._assets.values()]
-        }
-        await self._store.async_save(data)
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to persist to storage."""
+        return {"assets": self.asset_dicts}
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Schedule a coalesced save of all assets.
+
+        Rapid successive mutations are written to disk once after
+        SAVE_DELAY seconds instead of rewriting the full file each time.
+        Called on every mutation, so it also drops the serialized list.
+        """
+        self._asset_dicts = None
+        self._assets_json = None
+        self._dirty = True
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    async def async_flush(self) -> None:
+        """Write any pending changes to storage immediately.
+
+        Called on unload so a reload does not read stale data from disk
+        while a delayed save is still pending (or has failed).  A no-op
+        when nothing has changed since load or the last flush.
+        """
+        if not self._dirty:
+            return
+        await self._store.async_save(self._data_to_save())
+        self._dirty = False
         _LOGGER.debug("Saved %d assets", len(self._assets))
 
     @callback  # [M-02] Mark as @callback per HA convention
     def add_listener(
-        self, listener: Callable[[], None]  # [H-02] Correct type hint
+        self,
+        listener: Callable[[], None],  # [H-02] Correct type hint
+        asset_id: str | None = None,
     ) -> Callable[[], None]:
         """Add a listener for updates.
 
+        With *asset_id*, the listener only fires for changes to that asset;
+        otherwise it fires whenever assets are created or deleted.
         Returns a callable that removes the listener when invoked.
         [M-03] Uses dict + counter for O(1) add/remove.
         """
         self._last_listener_id += 1
         listener_id = self._last_listener_id
-        self._listeners[listener_id] = listener
-        # Return a bound removal callable (same pattern as DataUpdateCoordinator)
-        return partial(self._async_remove_listener, listener_id)
+        bucket = self._listeners.setdefault(asset_id, {})
+        bucket[listener_id] = listener
+        self._listener_snapshots[asset_id] = tuple(bucket.values())
+
+        # Return a removal closure (same pattern as DataUpdateCoordinator)
+        @callback
+        def remove_listener() -> None:
+            """Remove the listener."""
+            self._async_remove_listener(asset_id, listener_id)
+
+        return remove_listener
 
     @callback  # [M-02] Mark as @callback per HA convention
-    def _async_remove_listener(self, listener_id: int) -> None:
+    def _async_remove_listener(
+        self, asset_id: str | None, listener_id: int
+    ) -> None:
         """Remove a listener by its id."""
-        self._listeners.pop(listener_id, None)
+        bucket = self._listeners.get(asset_id)
+        if bucket is None or bucket.pop(listener_id, None) is None:
+            return
+        if bucket:
+            self._listener_snapshots[asset_id] = tuple(bucket.values())
+        else:
+            del self._listeners[asset_id]
+            del self._listener_snapshots[asset_id]
 
     @callback  # [M-02] Mark as @callback per HA convention
-    def _notify_listeners(self) -> None:
-        """Notify all listeners of an update."""
-        for listener in list(self._listeners.values()):
+    def _notify_listeners(self, asset_id: str | None = None) -> None:
+        """Notify the listeners of *asset_id*.
+
+        Without *asset_id*, notifies the catch-all listeners, which only
+        care about assets being created or deleted; field updates therefore
+        do not wake them.
+        Iterates snapshots so listeners may unsubscribe during dispatch.
+        """
+        for listener in self._listener_snapshots.get(asset_id, ()):
             listener()
 
+    @callback
+    def async_add_entity(self, asset_id: str, entity: Entity) -> Callable[[], None]:
+        """Track an entity belonging to *asset_id*.
+
+        Returns a callable that stops tracking the entity when invoked.
+        """
+        self._entities.setdefault(asset_id, set()).add(entity)
+
+        @callback
+        def remove_entity() -> None:
+            """Stop tracking the entity."""
+            if (entities := self._entities.get(asset_id)) is not None:
+                entities.discard(entity)
+                if not entities:
+                    del self._entities[asset_id]
+
+        return remove_entity
+
     async def async_create_asset(self, name: str) -> Asset:
         """Create a new asset."""
-        # [H-04] Use full UUID (32 hex chars) to avoid collision risk
-        asset_id = f"asset_{uuid.uuid4().hex}"
-        # [L-11] Unified datetime via _ensure_aware_utc
-        now = _ensure_aware_utc(dt_util.utcnow())
-        asset = Asset(
-            id=asset_id,
-            name=name,
-            created_at=now,
-            updated_at=now,
-        )
-        self._assets[asset_id] = asset
-        await self._async_save()
-        self._notify_listeners()
-        _LOGGER.info("Created asset: %s (%s)", name, asset_id)
-        return asset
+        return (await self.async_create_assets([name]))[0]
+
+    async def async_create_assets(self, names: Iterable[str]) -> list[Asset]:
+        """Create several assets with a single save + single notify."""
+        # [L-11] utcnow() is already timezone-aware UTC
+        now = dt_util.utcnow()
+        created: list[Asset] = []
+        for name in names:
+            asset_id = _generate_asset_id()
+            asset = Asset(
+                id=asset_id,
+                name=name,
+                created_at=now,
+                updated_at=now,
+            )
+            self._assets[asset_id] = asset
+            self._id_to_name[asset_id] = name
+            created.append(asset)
+            _LOGGER.info("Created asset: %s (%s)", name, asset_id)
+
+        if created:
+            self._async_schedule_save()
+            self._notify_listeners()
+        return created
 
     async def async_create_asset_full(
         self,
@@ -288,10 +472,9 @@ class AssetCoordinator:
         avoiding the N saves + N notifies that would result from calling
         async_update_asset for each field after creation.
         """
-        # [H-04] Use full UUID (32 hex chars)
-        asset_id = f"asset_{uuid.uuid4().hex}"
-        # [L-11] Unified datetime via _ensure_aware_utc
-        now = _ensure_aware_utc(dt_util.utcnow())
+        asset_id = _generate_asset_id()
+        # [L-11] utcnow() is already timezone-aware UTC
+        now = dt_util.utcnow()
         asset = Asset(
             id=asset_id,
             name=name,
@@ -310,7 +493,8 @@ class AssetCoordinator:
             updated_at=now,
         )
         self._assets[asset_id] = asset
-        await self._async_save()
+        self._id_to_name[asset_id] = name
+        self._async_schedule_save()
         self._notify_listeners()
         _LOGGER.info("Created asset (full): %s (%s)", name, asset_id)
         return asset
@@ -320,7 +504,9 @@ class AssetCoordinator:
         if asset_id not in self._assets:
             return False
         asset = self._assets.pop(asset_id)
-        await self._async_save()
+        self._id_to_name.pop(asset_id, None)
+        self._async_schedule_save()
+        entities = self._entities.pop(asset_id, None)
 
         # Remove the device from the device registry so it no longer
         # appears in Device & Services after the asset is deleted.
@@ -329,8 +515,29 @@ class AssetCoordinator:
         if device is not None:
             dev_reg.async_remove_device(device.id)
 
+        # Notify before awaiting anything, so listeners never observe the
+        # asset as deleted without having been told.  Only the catch-all
+        # listeners are told: the asset's own entities are removed below,
+        # and waking them would make each schedule a second removal.
         self._notify_listeners()
         _LOGGER.info("Deleted asset: %s (%s)", asset.name, asset_id)
+
+        # Remove the asset's entities together rather than letting each
+        # one schedule its own removal task from the listener callback.
+        # A failing entity must not prevent the others from being removed.
+        if entities:
+            results = await asyncio.gather(
+                *(entity.async_remove() for entity in entities),
+                return_exceptions=True,
+            )
+            for entity, result in zip(entities, results):
+                if isinstance(result, BaseException):
+                    _LOGGER.error(
+                        "Failed to remove entity %s of deleted asset %s: %s",
+                        entity.entity_id,
+                        asset_id,
+                        result,
+                    )
         return True
 
     async def async_update_asset(
@@ -344,55 +551,69 @@ class AssetCoordinator:
         [M-01] Validates that the value type matches the expected type
         for the given field before applying the update.
         """
-        if asset_id not in self._assets:
-            return False
+        return await self.async_update_asset_fields(asset_id, {field_name: value})
 
-        # [M-01] Input validation: reject unknown fields
-        expected_types = _FIELD_TYPES.get(field_name)
-        if expected_types is None:
-            _LOGGER.warning("Unknown field: %s", field_name)
-            return False
+    async def async_update_asset_fields(
+        self,
+        asset_id: str,
+        fields: dict[str, Any],
+    ) -> bool:
+        """Update several fields of an asset with a single save + notify.
 
-        # [M-01] Input validation: reject mismatched types
-        if not isinstance(value, expected_types):
-            _LOGGER.warning(
-                "Invalid type for field %s: expected %s, got %s",
-                field_name,
-                expected_types,
-                type(value).__name__,
-            )
+        [M-01] Every value is validated before any is applied, so one
+        invalid field leaves the asset untouched.
+        """
+        asset = self._assets.get(asset_id)
+        if asset is None:
             return False
 
-        asset = self._assets[asset_id]
-
-        if field_name == FIELD_NAME:
-            asset.name = value
-        elif field_name == FIELD_BRAND:
-            asset.brand = value
-        elif field_name == FIELD_CATEGORY:
-            asset.category = value
-        elif field_name == FIELD_VALUE:
-            asset.value = value
-        elif field_name == FIELD_PURCHASE_AT:
-            # [L-11] Ensure timezone-aware UTC
-            asset.purchase_at = (
-                _ensure_aware_utc(value) if value is not None else None
-            )
-        elif field_name == FIELD_WARRANTY_UNTIL:
-            # [L-11] Ensure timezone-aware UTC
-            asset.warranty_until = (
-                _ensure_aware_utc(value) if value is not None else None
-            )
-        elif field_name == FIELD_MANUAL_MD:
-            asset.manual_md = value
-        elif field_name == FIELD_MAINTENANCE_MD:
-            asset.maintenance_md = value
-
-        # [L-11] Unified datetime handling
-        asset.updated_at = _ensure_aware_utc(dt_util.utcnow())
-        await self._async_save()
-        self._notify_listeners()
-        _LOGGER.debug("Updated asset %s field %s", asset_id, field_name)
+        changes: dict[str, Any] = {}
+        for field_name, value in fields.items():
+            # [M-01] Input validation: reject unknown fields.  Callers pass
+            # the FIELD_* constants themselves, so this lookup already hits
+            # the identity fast path with a cached hash; interning would
+            # only add a second dict lookup per call.
+            spec = _FIELD_SPECS.get(field_name)
+            if spec is None:
+                _LOGGER.warning("Unknown field: %s", field_name)
+                return False
+            expected_types, is_datetime = spec
+
+            # [M-01] Input validation: reject mismatched types
+            if not isinstance(value, expected_types):
+                _LOGGER.warning(
+                    "Invalid type for field %s: expected %s, got %s",
+                    field_name,
+                    expected_types,
+                    type(value).__name__,
+                )
+                return False
+
+            if is_datetime and value is not None:
+                # [L-11] Ensure timezone-aware UTC
+                value = _ensure_aware_utc(value)
+
+            # Re-asserting the current value is a no-op.
+            if getattr(asset, field_name) != value:
+                changes[field_name] = value
+
+        # Nothing changed: skip the save and the listener fan-out.
+        if not changes:
+            return True
+
+        # FIELD_* constants match the Asset attribute names, so the
+        # validated field names can be assigned directly.
+        for field_name, value in changes.items():
+            setattr(asset, field_name, value)
+        if FIELD_NAME in changes:
+            self._id_to_name[asset_id] = changes[FIELD_NAME]
+
+        # [L-11] utcnow() is already timezone-aware UTC
+        asset.updated_at = dt_util.utcnow()
+        asset._cached_dict = None
+        self._async_schedule_save()
+        self._notify_listeners(asset_id)
+        _LOGGER.debug("Updated asset %s fields %s", asset_id, list(changes))
         return True
 
     def get_asset(self, asset_id: str) -> Asset | None:
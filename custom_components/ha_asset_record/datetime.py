@@ -4,22 +4,15 @@ from __future__ import annotations
 
 from datetime import datetime
 import logging
-from typing import Any
 
 from homeassistant.components.datetime import DateTimeEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers import entity_registry as er
+from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
-from .const import (
-    ATTR_ASSET_ID,
-    DOMAIN,
-    FIELD_PURCHASE_AT,
-    FIELD_WARRANTY_UNTIL,
-)
+from .const import FIELD_PURCHASE_AT, FIELD_WARRANTY_UNTIL
 from .coordinator import Asset, AssetCoordinator
-from .entity import AssetEntity
+from .entity import AssetEntity, async_setup_asset_entities
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -30,33 +23,7 @@ async def async_setup_entry(
     async_add_entities: AddConfigEntryEntitiesCallback,  # [M-06]
 ) -> None:
     """Set up datetime entities."""
-    coordinator: AssetCoordinator = entry.runtime_data
-
-    entities: list[AssetDateTimeEntity] = []
-    for asset in coordinator.assets.values():
-        entities.extend(_create_datetime_entities(coordinator, asset))
-
-    async_add_entities(entities)
-
-    # Listen for new assets
-    @callback  # [M-08] Listener is called from the event loop.
-    def _async_add_asset_entities() -> None:
-        """Add entities for new assets."""
-        # [M-09] Use entity registry for dedup instead of local list.
-        ent_reg = er.async_get(hass)
-        new_entities: list[AssetDateTimeEntity] = []
-
-        for asset in coordinator.assets.values():
-            for entity in _create_datetime_entities(coordinator, asset):
-                if ent_reg.async_get_entity_id(
-                    "datetime", DOMAIN, entity.unique_id
-                ) is None:
-                    new_entities.append(entity)
-
-        if new_entities:
-            async_add_entities(new_entities)
-
-    entry.async_on_unload(coordinator.add_listener(_async_add_asset_entities))
+    async_setup_asset_entities(entry, async_add_entities, _create_datetime_entities)
 
 
 def _create_datetime_entities(
@@ -75,16 +42,7 @@ class AssetDateTimeEntity(AssetEntity, DateTimeEntity):
     @property
     def native_value(self) -> datetime | None:
         """Return the current datetime value."""
-        if self.field_name == FIELD_PURCHASE_AT:
-            return self.asset.purchase_at
-        if self.field_name == FIELD_WARRANTY_UNTIL:
-            return self.asset.warranty_until
-        return None
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return extra state attributes."""
-        return {ATTR_ASSET_ID: self.asset.id}
+        return self._get_value(self.asset)
 
     async def async_set_value(self, value: datetime) -> None:
         """Set the datetime value."""
@@ -2,14 +2,18 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Iterable
 import logging
+from operator import attrgetter
 
+from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import callback
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
-from .const import DOMAIN
+from .const import ATTR_ASSET_ID, DOMAIN
 from .coordinator import Asset, AssetCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -35,13 +39,17 @@ class AssetEntity(Entity):
         self.field_name = field_name
         self._attr_translation_key = translation_key
         self._attr_unique_id = f"{DOMAIN}_{asset.id}_{field_name}"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.asset.id)},
-            name=self.asset.name,
+        # FIELD_* constants equal the Asset attribute names, so one getter
+        # built here replaces per-read dispatch on field_name.
+        self._get_value = attrgetter(field_name)
+        # Field value last pushed to the state machine.
+        self._last_value = self._get_value(asset)
+        # The asset id never changes for an entity's lifetime.
+        self._attr_extra_state_attributes = {ATTR_ASSET_ID: asset.id}
+        # Built once; only the name can change (see _handle_coordinator_update).
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, asset.id)},
+            name=asset.name,
             manufacturer="Ha Asset Record",
             model="Asset",
         )
@@ -50,7 +58,12 @@ class AssetEntity(Entity):
         """When entity is added to hass."""
         await super().async_added_to_hass()
         self.async_on_remove(
-            self.coordinator.add_listener(self._handle_coordinator_update)
+            self.coordinator.add_listener(
+                self._handle_coordinator_update, self.asset.id
+            )
+        )
+        self.async_on_remove(
+            self.coordinator.async_add_entity(self.asset.id, self)
         )
 
     @callback  # [H-06] Called from the event loop.
@@ -59,6 +72,8 @@ class AssetEntity(Entity):
         updated_asset = self.coordinator.get_asset(self.asset.id)
 
         # [H-05] Asset was deleted -- self-remove from entity registry.
+        # async_delete_asset normally removes tracked entities itself; this
+        # is the fallback for entities it did not know about.
         if updated_asset is None:
             _LOGGER.debug(
                 "Asset %s was deleted, removing entity %s",
@@ -80,7 +95,67 @@ class AssetEntity(Entity):
         )
         if device is not None and device.name != updated_asset.name:
             dev_reg.async_update_device(device.id, name=updated_asset.name)
+        self._attr_device_info["name"] = updated_asset.name
 
         # Refresh the cached asset reference.
         self.asset = updated_asset
+
+        # Other fields of the same asset changed; this entity's state is
+        # unaffected.
+        value = self._get_value(updated_asset)
+        if value == self._last_value:
+            return
+        self._last_value = value
         self.async_write_ha_state()
+
+
+@callback
+def async_setup_asset_entities(
+    entry: ConfigEntry,
+    async_add_entities: AddConfigEntryEntitiesCallback,
+    create_entities: Callable[[AssetCoordinator, Asset], Iterable[AssetEntity]],
+) -> None:
+    """Add a platform's entities for every asset, now and as assets are created.
+
+    Shared by the platforms; *create_entities* builds the entities of one
+    asset.
+    """
+    coordinator: AssetCoordinator = entry.runtime_data
+
+    async_add_entities(
+        [
+            entity
+            for asset in coordinator.assets.values()
+            for entity in create_entities(coordinator, asset)
+        ]
+    )
+
+    # Asset ids this platform has created entities for; checked instead of
+    # building candidate entities and querying the entity registry.
+    known_asset_ids: set[str] = set(coordinator.assets)
+
+    @callback  # [M-08] Listener is called from the event loop.
+    def _async_add_new_asset_entities() -> None:
+        """Add entities for assets not seen before."""
+        # Only runs on create/delete, so scanning every asset is fine.
+        # Compare ids, not counts: a create and a delete can land between
+        # two notifications and leave the asset count unchanged.
+        assets = coordinator.assets
+        known_asset_ids.intersection_update(assets)
+        new_assets = [
+            asset
+            for asset_id, asset in assets.items()
+            if asset_id not in known_asset_ids
+        ]
+        if not new_assets:
+            return
+        known_asset_ids.update(asset.id for asset in new_assets)
+        async_add_entities(
+            [
+                entity
+                for asset in new_assets
+                for entity in create_entities(coordinator, asset)
+            ]
+        )
+
+    entry.async_on_unload(coordinator.add_listener(_async_add_new_asset_entities))
@@ -3,24 +3,20 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
 
 from homeassistant.components.number import NumberEntity, NumberMode
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers import entity_registry as er
+from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
 from .const import (
-    ATTR_ASSET_ID,
-    DOMAIN,
     FIELD_VALUE,
     VALUE_MAX,
     VALUE_MIN,
     VALUE_STEP,
 )
 from .coordinator import Asset, AssetCoordinator
-from .entity import AssetEntity
+from .entity import AssetEntity, async_setup_asset_entities
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -31,40 +27,14 @@ async def async_setup_entry(
     async_add_entities: AddConfigEntryEntitiesCallback,  # [M-06]
 ) -> None:
     """Set up number entities."""
-    coordinator: AssetCoordinator = entry.runtime_data
+    async_setup_asset_entities(entry, async_add_entities, _create_number_entities)
 
-    entities: list[AssetNumberEntity] = []
-    for asset in coordinator.assets.values():
-        entities.append(_create_number_entity(coordinator, asset))
 
-    async_add_entities(entities)
-
-    # Listen for new assets
-    @callback  # [M-08] Listener is called from the event loop.
-    def _async_add_asset_entities() -> None:
-        """Add entities for new assets."""
-        # [M-09] Use entity registry for dedup instead of local list.
-        ent_reg = er.async_get(hass)
-        new_entities: list[AssetNumberEntity] = []
-
-        for asset in coordinator.assets.values():
-            entity = _create_number_entity(coordinator, asset)
-            if ent_reg.async_get_entity_id(
-                "number", DOMAIN, entity.unique_id
-            ) is None:
-                new_entities.append(entity)
-
-        if new_entities:
-            async_add_entities(new_entities)
-
-    entry.async_on_unload(coordinator.add_listener(_async_add_asset_entities))
-
-
-def _create_number_entity(
+def _create_number_entities(
     coordinator: AssetCoordinator, asset: Asset
-) -> AssetNumberEntity:
-    """Create number entity for an asset."""
-    return AssetNumberEntity(coordinator, asset, FIELD_VALUE, "value")
+) -> list[AssetNumberEntity]:
+    """Create number entities for an asset."""
+    return [AssetNumberEntity(coordinator, asset, FIELD_VALUE, "value")]
 
 
 class AssetNumberEntity(AssetEntity, NumberEntity):
@@ -81,12 +51,7 @@ class AssetNumberEntity(AssetEntity, NumberEntity):
     @property
     def native_value(self) -> float | None:
         """Return the current value."""
-        return self.asset.value
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return extra state attributes."""
-        return {ATTR_ASSET_ID: self.asset.id}
+        return self._get_value(self.asset)
 
     async def async_set_native_value(self, value: float) -> None:
         """Set the value."""
@@ -2,13 +2,13 @@
 
 from __future__ import annotations
 
-import json
 import logging
 from pathlib import Path
 
 from homeassistant.components import frontend, panel_custom
 from homeassistant.components.http import StaticPathConfig
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.util.json import JSON_DECODE_EXCEPTIONS, json_loads
 
 from .const import DOMAIN
 
@@ -19,6 +19,10 @@ PANEL_COMPONENT_NAME = "ha-asset-panel"
 PANEL_TITLE = "Asset Record"
 PANEL_ICON = "mdi:devices"
 
+# Computed once; Path arithmetic is pure string work (no filesystem access),
+# so there is nothing to offload to the executor.
+_FRONTEND_DIR = str(Path(__file__).parent / "frontend")
+
 # [M-13] Key to track whether the static path has already been registered
 _DATA_STATIC_REGISTERED = f"{DOMAIN}_static_registered"
 
@@ -30,13 +34,15 @@ def _get_panel_version() -> str:
     Falls back to "0.0.0" if the manifest cannot be read.
 
     Note: This is called at module-load time (not from the event loop)
-    to avoid blocking I/O warnings.
+    to avoid blocking I/O warnings, which also makes it a one-shot read;
+    a lazily cached reader would do the file I/O on the event loop.
+    json_loads decodes the raw bytes directly, skipping the UTF-8 text step.
     """
     manifest_path = Path(__file__).parent / "manifest.json"
     try:
-        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        manifest = json_loads(manifest_path.read_bytes())
         return manifest.get("version", "0.0.0")
-    except (FileNotFoundError, json.JSONDecodeError, OSError) as err:
+    except (FileNotFoundError, OSError, *JSON_DECODE_EXCEPTIONS) as err:
         _LOGGER.warning("Could not read manifest.json for version: %s", err)
         return "0.0.0"
 
@@ -48,9 +54,6 @@ _PANEL_VERSION = _get_panel_version()
 
 async def async_register_panel(hass: HomeAssistant) -> None:
     """Register the panel."""
-    # Get the frontend directory path
-    frontend_dir = Path(__file__).parent / "frontend"
-
     # [M-15] Use pre-loaded version from module import
     panel_version = _PANEL_VERSION
 
@@ -60,7 +63,7 @@ async def async_register_panel(hass: HomeAssistant) -> None:
         await hass.http.async_register_static_paths([
             StaticPathConfig(
                 f"/{DOMAIN}/frontend",
-                str(frontend_dir),
+                _FRONTEND_DIR,
                 cache_headers=False,
             )
         ])
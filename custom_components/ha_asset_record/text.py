@@ -3,22 +3,15 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
 
 from homeassistant.components.text import TextEntity, TextMode
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers import entity_registry as er
+from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
-from .const import (
-    ATTR_ASSET_ID,
-    DOMAIN,
-    FIELD_BRAND,
-    FIELD_CATEGORY,
-)
+from .const import FIELD_BRAND, FIELD_CATEGORY
 from .coordinator import Asset, AssetCoordinator
-from .entity import AssetEntity
+from .entity import AssetEntity, async_setup_asset_entities
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -29,33 +22,7 @@ async def async_setup_entry(
     async_add_entities: AddConfigEntryEntitiesCallback,  # [M-06]
 ) -> None:
     """Set up text entities."""
-    coordinator: AssetCoordinator = entry.runtime_data
-
-    entities: list[AssetTextEntity] = []
-    for asset in coordinator.assets.values():
-        entities.extend(_create_text_entities(coordinator, asset))
-
-    async_add_entities(entities)
-
-    # Listen for new assets
-    @callback  # [M-08] Listener is called from the event loop.
-    def _async_add_asset_entities() -> None:
-        """Add entities for new assets."""
-        # [M-09] Use entity registry for dedup instead of local list.
-        ent_reg = er.async_get(hass)
-        new_entities: list[AssetTextEntity] = []
-
-        for asset in coordinator.assets.values():
-            for entity in _create_text_entities(coordinator, asset):
-                if ent_reg.async_get_entity_id(
-                    "text", DOMAIN, entity.unique_id
-                ) is None:
-                    new_entities.append(entity)
-
-        if new_entities:
-            async_add_entities(new_entities)
-
-    entry.async_on_unload(coordinator.add_listener(_async_add_asset_entities))
+    async_setup_asset_entities(entry, async_add_entities, _create_text_entities)
 
 
 def _create_text_entities(
@@ -92,25 +59,9 @@ class AssetTextEntity(AssetEntity, TextEntity):
         [L-09] Return None instead of empty string for unset fields,
         which is the HA convention for "no value".
         """
-        value = self._get_field_value()
+        value = self._get_value(self.asset)
         return value if value else None
 
-    def _get_field_value(self) -> str:
-        """Get the raw value for this field."""
-        if self.field_name == FIELD_BRAND:
-            return self.asset.brand
-        if self.field_name == FIELD_CATEGORY:
-            return self.asset.category
-        return ""
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return extra state attributes.
-
-        [L-08] Return type is dict[str, Any], not dict[str, str].
-        """
-        return {ATTR_ASSET_ID: self.asset.id}
-
     async def async_set_value(self, value: str) -> None:
         """Set the text value."""
         await self.coordinator.async_update_asset(
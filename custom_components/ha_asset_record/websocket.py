@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 from datetime import datetime
+from functools import lru_cache
 import logging
+import re
 from typing import Any
 
 import voluptuous as vol
@@ -27,24 +29,76 @@ from .coordinator import AssetCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+# [H-12] Handlers read the coordinator straight from hass.data[DOMAIN]
+# (single-instance integration) instead of going through a helper.
+
 # [L-13] Regex pattern for asset_id validation.
 # Asset IDs are generated as "asset_" + uuid4().hex (32 hex chars).
 ASSET_ID_PATTERN = r"^asset_[a-f0-9]+$"
+# Compiled once and shared by every schema that takes an asset_id.  The
+# length is not pinned to 32 so ids created before [H-04] stay addressable.
+_ASSET_ID_RE = re.compile(ASSET_ID_PATTERN)
+_ASSET_ID_SCHEMA = vol.All(str, vol.Match(_ASSET_ID_RE))
+
+# [M-11] String length validation.  Validators are built once and shared by
+# the create and update schemas instead of being duplicated per command.
+_SHORT_TEXT = vol.All(str, vol.Length(max=255))
+_LONG_TEXT = vol.All(str, vol.Length(max=65535))
+_OPTIONAL_DATETIME = vol.Any(str, None)
+_OPTIONAL_FIELDS_SCHEMA = {
+    vol.Optional("brand"): _SHORT_TEXT,
+    vol.Optional("category"): _SHORT_TEXT,
+    vol.Optional("value"): vol.Coerce(float),
+    vol.Optional("purchase_at"): _OPTIONAL_DATETIME,
+    vol.Optional("warranty_until"): _OPTIONAL_DATETIME,
+    vol.Optional("manual_md"): _LONG_TEXT,
+    vol.Optional("maintenance_md"): _LONG_TEXT,
+}
+
+# Message key -> coordinator field for the optional update fields.  Values
+# in _SIMPLE_FIELDS are stored as validated; _DATETIME_FIELDS are parsed.
+_SIMPLE_FIELDS = (
+    ("brand", FIELD_BRAND),
+    ("category", FIELD_CATEGORY),
+    ("value", FIELD_VALUE),
+    ("manual_md", FIELD_MANUAL_MD),
+    ("maintenance_md", FIELD_MAINTENANCE_MD),
+)
+_DATETIME_FIELDS = (
+    ("purchase_at", FIELD_PURCHASE_AT),
+    ("warranty_until", FIELD_WARRANTY_UNTIL),
+)
 
 
 def _parse_datetime(value: str | None) -> datetime | None:
-    """Parse a datetime string using HA's dt_util.
+    """Parse a datetime string.
 
-    [H-10] Uses dt_util.parse_datetime() instead of datetime.fromisoformat().
     Returns the parsed datetime (timezone-aware UTC) or None if the value is
     empty/None.  Raises ValueError if the string is non-empty but unparseable
     so the caller can send a proper error to the client ([H-09]).
     """
     if not value:
         return None
-    parsed = dt_util.parse_datetime(value)
-    if parsed is None:
-        raise ValueError(f"Invalid datetime format: {value!r}")
+    return _parse_datetime_str(value)
+
+
+@lru_cache(maxsize=1024)
+def _parse_datetime_str(value: str) -> datetime:
+    """Parse a non-empty datetime string into an aware UTC datetime.
+
+    The frontend sends ISO 8601, which the C datetime.fromisoformat()
+    handles directly (including a trailing "Z" on Python 3.11+).
+    [H-10] Anything else falls back to dt_util.parse_datetime(), so every
+    format it accepts still works.
+    Memoized: edits and bulk creates resend the same timestamps, and
+    datetimes are immutable.  A ValueError is raised (and not cached).
+    """
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        parsed = dt_util.parse_datetime(value)
+        if parsed is None:
+            raise ValueError(f"Invalid datetime format: {value!r}") from None
     # Ensure timezone-aware UTC
     if parsed.tzinfo is None:
         return parsed.replace(tzinfo=dt_util.UTC)
@@ -54,18 +108,8 @@ def _parse_datetime(value: str | None) -> datetime | None:
 @callback
 def async_register_websocket_commands(hass: HomeAssistant) -> None:
     """Register websocket commands."""
-    websocket_api.async_register_command(hass, ws_list_assets)
-    websocket_api.async_register_command(hass, ws_create_asset)
-    websocket_api.async_register_command(hass, ws_update_asset)
-    websocket_api.async_register_command(hass, ws_delete_asset)
-
-
-def _get_coordinator_from_hass(hass: HomeAssistant) -> AssetCoordinator | None:
-    """Get the coordinator from hass.data.
-
-    [H-12] Direct lookup via hass.data[DOMAIN] instead of iterating config entries.
-    """
-    return hass.data.get(DOMAIN)
+    for command in (ws_list_assets, ws_create_asset, ws_update_asset, ws_delete_asset):
+        websocket_api.async_register_command(hass, command)
 
 
 @websocket_api.websocket_command(
@@ -73,20 +117,25 @@ def _get_coordinator_from_hass(hass: HomeAssistant) -> AssetCoordinator | None:
         vol.Required("type"): "ha_asset_record/list",
     }
 )
-@websocket_api.async_response
-async def ws_list_assets(
+@callback
+def ws_list_assets(
     hass: HomeAssistant,
     connection: websocket_api.ActiveConnection,
     msg: dict[str, Any],
 ) -> None:
     """Handle list assets command."""
-    coordinator = _get_coordinator_from_hass(hass)
+    coordinator: AssetCoordinator | None = hass.data.get(DOMAIN)
     if coordinator is None:
         connection.send_error(msg["id"], "not_found", "Integration not configured")
         return
 
-    assets = [asset.to_dict() for asset in coordinator.assets.values()]
-    connection.send_result(msg["id"], {"assets": assets})
+    # The encoded list is cached on the coordinator, so repeated polling
+    # only wraps the prebuilt payload in a result envelope.
+    connection.send_message(
+        websocket_api.messages.construct_result_message(
+            msg["id"], coordinator.assets_json
+        )
+    )
 
 
 # [L-12] Write commands require admin access.
@@ -94,15 +143,8 @@ async def ws_list_assets(
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "ha_asset_record/create",
-        # [M-11] String length validation
-        vol.Required("name"): vol.All(str, vol.Length(max=255)),
-        vol.Optional("brand"): vol.All(str, vol.Length(max=255)),
-        vol.Optional("category"): vol.All(str, vol.Length(max=255)),
-        vol.Optional("value"): vol.Coerce(float),
-        vol.Optional("purchase_at"): vol.Any(str, None),
-        vol.Optional("warranty_until"): vol.Any(str, None),
-        vol.Optional("manual_md"): vol.All(str, vol.Length(max=65535)),
-        vol.Optional("maintenance_md"): vol.All(str, vol.Length(max=65535)),
+        vol.Required("name"): _SHORT_TEXT,
+        **_OPTIONAL_FIELDS_SCHEMA,
     }
 )
 @websocket_api.async_response
@@ -112,13 +154,13 @@ async def ws_create_asset(
     msg: dict[str, Any],
 ) -> None:
     """Handle create asset command."""
-    coordinator = _get_coordinator_from_hass(hass)
+    coordinator: AssetCoordinator | None = hass.data.get(DOMAIN)
     if coordinator is None:
         connection.send_error(msg["id"], "not_found", "Integration not configured")
         return
 
     # Validate name
-    name = msg["name"].strip() if msg["name"] else ""
+    name = msg["name"].strip()
     if not name:
         connection.send_error(msg["id"], "invalid_input", "Asset name is required")
         return
@@ -169,16 +211,9 @@ async def ws_create_asset(
     {
         vol.Required("type"): "ha_asset_record/update",
         # [L-13] Validate asset_id format
-        vol.Required("asset_id"): vol.All(str, vol.Match(ASSET_ID_PATTERN)),
-        # [M-11] String length validation
-        vol.Optional("name"): vol.All(str, vol.Length(max=255)),
-        vol.Optional("brand"): vol.All(str, vol.Length(max=255)),
-        vol.Optional("category"): vol.All(str, vol.Length(max=255)),
-        vol.Optional("value"): vol.Coerce(float),
-        vol.Optional("purchase_at"): vol.Any(str, None),
-        vol.Optional("warranty_until"): vol.Any(str, None),
-        vol.Optional("manual_md"): vol.All(str, vol.Length(max=65535)),
-        vol.Optional("maintenance_md"): vol.All(str, vol.Length(max=65535)),
+        vol.Required("asset_id"): _ASSET_ID_SCHEMA,
+        vol.Optional("name"): _SHORT_TEXT,
+        **_OPTIONAL_FIELDS_SCHEMA,
     }
 )
 @websocket_api.async_response
@@ -188,7 +223,7 @@ async def ws_update_asset(
     msg: dict[str, Any],
 ) -> None:
     """Handle update asset command."""
-    coordinator = _get_coordinator_from_hass(hass)
+    coordinator: AssetCoordinator | None = hass.data.get(DOMAIN)
     if coordinator is None:
         connection.send_error(msg["id"], "not_found", "Integration not configured")
         return
@@ -199,64 +234,42 @@ async def ws_update_asset(
         connection.send_error(msg["id"], "not_found", f"Asset {asset_id} not found")
         return
 
-    # Update name if provided
+    # Collect all changes first so invalid input is rejected before
+    # anything is applied, then update with a single save + notify.
+    fields: dict[str, Any] = {}
+
     if "name" in msg:
-        name = msg["name"].strip() if msg["name"] else ""
+        name = msg["name"].strip()
         if not name:
             connection.send_error(
                 msg["id"], "invalid_input", "Asset name cannot be empty"
             )
             return
-        await coordinator.async_update_asset(asset_id, FIELD_NAME, name)
+        fields[FIELD_NAME] = name
 
-    # Update other fields
-    if "brand" in msg:
-        await coordinator.async_update_asset(asset_id, FIELD_BRAND, msg["brand"])
-    if "category" in msg:
-        await coordinator.async_update_asset(asset_id, FIELD_CATEGORY, msg["category"])
-    if "value" in msg:
-        await coordinator.async_update_asset(asset_id, FIELD_VALUE, msg["value"])
+    for key, field_name in _SIMPLE_FIELDS:
+        if key in msg:
+            fields[field_name] = msg[key]
 
     # [H-09] Parse datetime fields with error responses for invalid values
-    if "purchase_at" in msg:
-        try:
-            purchase_at = _parse_datetime(msg["purchase_at"])
-        except ValueError:
-            connection.send_error(
-                msg["id"],
-                "invalid_format",
-                f"Invalid purchase_at datetime: {msg['purchase_at']!r}",
-            )
-            return
-        await coordinator.async_update_asset(asset_id, FIELD_PURCHASE_AT, purchase_at)
-
-    if "warranty_until" in msg:
-        try:
-            warranty_until = _parse_datetime(msg["warranty_until"])
-        except ValueError:
-            connection.send_error(
-                msg["id"],
-                "invalid_format",
-                f"Invalid warranty_until datetime: {msg['warranty_until']!r}",
-            )
-            return
-        await coordinator.async_update_asset(
-            asset_id, FIELD_WARRANTY_UNTIL, warranty_until
-        )
-
-    if "manual_md" in msg:
-        await coordinator.async_update_asset(asset_id, FIELD_MANUAL_MD, msg["manual_md"])
-    if "maintenance_md" in msg:
-        await coordinator.async_update_asset(
-            asset_id, FIELD_MAINTENANCE_MD, msg["maintenance_md"]
-        )
-
-    # [M-12] Return updated asset dict (consistent with ws_create_asset)
-    updated_asset = coordinator.get_asset(asset_id)
-    connection.send_result(
-        msg["id"],
-        {"asset": updated_asset.to_dict() if updated_asset else None},
-    )
+    for key, field_name in _DATETIME_FIELDS:
+        if key in msg:
+            try:
+                fields[field_name] = _parse_datetime(msg[key])
+            except ValueError:
+                connection.send_error(
+                    msg["id"],
+                    "invalid_format",
+                    f"Invalid {key} datetime: {msg[key]!r}",
+                )
+                return
+
+    await coordinator.async_update_asset_fields(asset_id, fields)
+
+    # [M-12] Return updated asset dict (consistent with ws_create_asset).
+    # The coordinator mutates the Asset in place, so the reference fetched
+    # above is already current.
+    connection.send_result(msg["id"], {"asset": asset.to_dict()})
 
 
 # [L-12] Write commands require admin access.
@@ -265,7 +278,7 @@ async def ws_update_asset(
     {
         vol.Required("type"): "ha_asset_record/delete",
         # [L-13] Validate asset_id format
-        vol.Required("asset_id"): vol.All(str, vol.Match(ASSET_ID_PATTERN)),
+        vol.Required("asset_id"): _ASSET_ID_SCHEMA,
     }
 )
 @websocket_api.async_response
@@ -275,7 +288,7 @@ async def ws_delete_asset(
     msg: dict[str, Any],
 ) -> None:
     """Handle delete asset command."""
-    coordinator = _get_coordinator_from_hass(hass)
+    coordinator: AssetCoordinator | None = hass.data.get(DOMAIN)
     if coordinator is None:
         connection.send_error(msg["id"], "not_found", "Integration not configured")
         return